@@ -0,0 +1,157 @@
+"""Tight integer loops used by the evaluators.
+
+The loops are compiled with numba when it is installed (`pip install seqnereval[numba]`),
+otherwise they run as plain Python over lists.
+"""
+from typing import List
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+
+    def njit(*args, **kwargs):
+        """Stand-in for `numba.njit` that leaves the function uncompiled."""
+        def decorator(fn): return fn
+        return decorator
+
+# Classification codes emitted while walking the spans of a document.
+TYPE_MATCH_BOUNDS_MATCH = 0
+TYPE_MISMATCH_BOUNDS_MATCH = 1
+TYPE_MATCH_BOUNDS_PARTIAL = 2
+TYPE_MISMATCH_BOUNDS_PARTIAL = 3
+MISSED_GOLD_SPAN = 4
+UNECESSARY_PREDICTED_SPAN = 5
+
+# The type mismatch codes follow their type match counterparts, so a code can be picked
+# from the type comparison without branching on it.
+TYPE_MISMATCH_OFFSET = 1
+
+
+def int_arrays(values: List[int], lengths: List[int]) -> list:
+    """Splits a flat list of ints into consecutive arrays of the given lengths, in the array type
+       consumed by the kernels. With numpy the arrays are views sharing a single int32 buffer.
+    """
+    if not lengths:
+        return []
+    if np is None:
+        arrays, offset = [], 0
+        for length in lengths:
+            arrays.append(values[offset:offset+length])
+            offset += length
+        return arrays
+    return np.split(np.array(values, dtype=np.int32), np.cumsum(lengths[:-1], dtype=np.int64))
+
+
+def empty_output_arrays(size: int):
+    """Allocates the (codes, gold indices, predicted indices) output arrays for `classify`.
+    """
+    if np is None:
+        return [0] * size, [0] * size, [0] * size
+    return np.empty(size, dtype=np.int8), np.empty(size, dtype=np.int32), np.empty(size, dtype=np.int32)
+
+
+def to_list(array, length: int) -> List[int]:
+    """Returns the first `length` items of a kernel array as a list of Python ints.
+    """
+    if np is None:
+        return array[:length]
+    return array[:length].tolist()
+
+
+@njit(cache=True)
+def classify(gold_starts, gold_ends, gold_types, pred_starts, pred_ends, pred_types,
+             out_codes, out_gold_idx, out_pred_idx):
+    """Walks the sorted gold and predicted spans of a document and classifies them into
+       the error scenarios, until either of the span lists is exhausted.
+
+    Args:
+        gold_starts, gold_ends, gold_types: start indices, end indices and type ids of gold spans.
+        pred_starts, pred_ends, pred_types: start indices, end indices and type ids of predicted spans.
+        out_codes: receives the classification code of every scenario found.
+        out_gold_idx: receives the gold span index of every scenario found, -1 if not applicable.
+        out_pred_idx: receives the predicted span index of every scenario found, -1 if not applicable.
+            The output arrays must be able to hold len(gold_starts) + len(pred_starts) items.
+
+    Returns:
+        Tuple[int, int, int]: (number of scenarios written to the output arrays,
+            index of the first gold span left over, index of the first predicted span left over).
+            Left over gold spans were missed (Scenario III), left over predicted spans were
+            not necessary (Scenario II).
+    """
+    # to check if the gold span or pred span was overlapping in last step
+    gold_part_overlap_in_last_step, pred_part_overlap_in_last_step = 0, 0
+
+    gold_idx, pred_idx = 0, 0
+    count = 0
+    n_gold, n_pred = len(gold_starts), len(pred_starts)
+
+    while gold_idx < n_gold and pred_idx < n_pred:
+        # read the bounds and types of the current pair only once per step
+        gs, ge, gt = gold_starts[gold_idx], gold_ends[gold_idx], gold_types[gold_idx]
+        ps, pe, pt = pred_starts[pred_idx], pred_ends[pred_idx], pred_types[pred_idx]
+
+        if gs == ps and ge == pe:
+            # Scenario I: Both entity type/labels and spans match perfectly
+            # or Scenario IV: Wrong Entity types but, spans match perfectly
+            out_codes[count] = TYPE_MATCH_BOUNDS_MATCH + TYPE_MISMATCH_OFFSET * (gt != pt)
+            out_gold_idx[count] = gold_idx
+            out_pred_idx[count] = pred_idx
+            count += 1
+
+            # it is safe to move cursor over
+            # as overlapping spans are not allowed within the predicted entity spans list
+            # and is also not allowed within gold entity span list
+            gold_idx += 1
+            pred_idx += 1
+
+            gold_part_overlap_in_last_step, pred_part_overlap_in_last_step = 0, 0
+
+        elif gs <= pe and ps <= ge:
+            # Scenario V: Correct Entity Type, partial span overlap
+            # or Scenario VI: Wrong Entity Type, partial span overlap
+            out_codes[count] = TYPE_MATCH_BOUNDS_PARTIAL + TYPE_MISMATCH_OFFSET * (gt != pt)
+            out_gold_idx[count] = gold_idx
+            out_pred_idx[count] = pred_idx
+            count += 1
+
+            if pe > ge:
+                pred_part_overlap_in_last_step = 1
+                gold_idx += 1
+            elif pe < ge:
+                gold_part_overlap_in_last_step = 1
+                pred_idx += 1
+            else:
+                gold_idx += 1
+                pred_idx += 1
+                gold_part_overlap_in_last_step, pred_part_overlap_in_last_step = 0, 0
+
+        elif ps > ge:
+            if not gold_part_overlap_in_last_step:
+                # Scenario III system missed an entity
+                out_codes[count] = MISSED_GOLD_SPAN
+                out_gold_idx[count] = gold_idx
+                out_pred_idx[count] = -1
+                count += 1
+
+            gold_idx += 1
+            gold_part_overlap_in_last_step = 0
+        else:
+            if not pred_part_overlap_in_last_step:
+                # Scenario II system hypothesised an extra entity
+                out_codes[count] = UNECESSARY_PREDICTED_SPAN
+                out_gold_idx[count] = -1
+                out_pred_idx[count] = pred_idx
+                count += 1
+
+            pred_idx += 1
+            pred_part_overlap_in_last_step = 1
+
+    # spans that partially overlapped in the last step are already accounted for
+    if gold_part_overlap_in_last_step:
+        gold_idx += 1
+    if pred_part_overlap_in_last_step:
+        pred_idx += 1
+
+    return count, gold_idx, pred_idx
@@ -1,12 +1,26 @@
 from .models import ResultAggregator, Span
+from . import _kernels
 from collections import defaultdict
-from typing import List, Tuple
+from operator import attrgetter
+from typing import Dict, List, Tuple
+
+
+_GOLD_PREDICTED_PAIR_HANDLERS = {
+    _kernels.TYPE_MATCH_BOUNDS_MATCH: ResultAggregator.add_type_match_bounds_match,
+    _kernels.TYPE_MISMATCH_BOUNDS_MATCH: ResultAggregator.add_type_mismatch_bounds_match,
+    _kernels.TYPE_MATCH_BOUNDS_PARTIAL: ResultAggregator.add_type_match_bounds_partial,
+    _kernels.TYPE_MISMATCH_BOUNDS_PARTIAL: ResultAggregator.add_type_mismatch_bounds_partial,
+}
+
+# spans are ordered by their bounds, (start_idx, end_idx)
+_SPAN_SORT_KEY = attrgetter('start_idx', 'end_idx')
 
 
 class NEREvaluator:
     def __init__(self, gold_entity_span_lists: List[List[Span]], pred_entity_span_lists: List[List[Span]]):
         """
-        Constructor for NEREvaluator
+        Constructor for NEREvaluator, the evaluator keeps sorted copies of the span lists
+        so the lists passed in are left untouched.
 
         Args:
             gold_entity_span_lists (List[List[Span]]): List of gold entity spans lists for different documents.
@@ -16,200 +30,176 @@ class NEREvaluator:
             raise Exception(f'# of documents for which golden tags were provided {len(gold_entity_span_lists)}'
                             f'!= # of documents for which golden tags were provided {len(pred_entity_span_lists)}')
 
-        self.gold_entity_span_lists = gold_entity_span_lists
-        self.pred_entity_span_lists = pred_entity_span_lists
+        # sort the entity lists once so we can make the evaluation faster (O(n)).
+        self.gold_entity_span_lists = [sorted(gold_entity_spans, key=_SPAN_SORT_KEY)
+                                       for gold_entity_spans in gold_entity_span_lists]
+        self.pred_entity_span_lists = [sorted(pred_entity_spans, key=_SPAN_SORT_KEY)
+                                       for pred_entity_spans in pred_entity_span_lists]
 
         # TODO: check for overlapping spans and throw exceptions
 
-        self.unique_gold_tags = list(
-            set([span.span_type
-                 for gold_entity_span_list in gold_entity_span_lists
-                 for span in gold_entity_span_list]))
-
-        self.results = ResultAggregator()
-        self.results_grouped_by_tags = defaultdict(
-            lambda: ResultAggregator())
-
-    def evaluate(self) -> Tuple[ResultAggregator, ResultAggregator]:
-        """Runs the evaluation and return results
-
-        Returns:
-            Tuple[ResultAggregator, ResultAggregator]: (Results, Results Grouped by tags)
-        """
-        results_by_doc = []
-        results = ResultAggregator()
+        # unique tags in the order they are first seen, so the results are reproducible across runs.
+        self.unique_gold_tags = list(dict.fromkeys(
+            span.span_type
+            for gold_entity_span_list in self.gold_entity_span_lists
+            for span in gold_entity_span_list))
 
-        for gold_spans, pred_spans in zip(self.gold_entity_span_lists, self.pred_entity_span_lists):
-            results_for_curr_doc = self.__calculate_metrics_for_doc(
-                gold_spans, pred_spans)
-            results_by_doc.append(results_for_curr_doc)
-            results.append_result_aggregator(results_for_curr_doc[0])
+        # predicted types that never occur in the gold spans share the id -1,
+        # they can never be equal to a gold type anyway.
+        self._type_ids = {tag: type_id for type_id, tag in enumerate(self.unique_gold_tags)}
+        self._gold_soa = self._build_soa(self.gold_entity_span_lists)
+        self._pred_soa = self._build_soa(self.pred_entity_span_lists)
 
-        return results, results_for_curr_doc
+        self.results = ResultAggregator()
+        self.results_grouped_by_tags = defaultdict(ResultAggregator)
 
-    def __calculate_metrics_for_doc(self, gold_entity_spans: List[Span], pred_entity_spans: List[Span]) -> Tuple[ResultAggregator, ResultAggregator]:
-        """Calculate the metrics for a particular document.
+    def _build_soa(self, span_lists: List[List[Span]]) -> List[Tuple]:
+        """Lays out the bounds and types of the spans of each document as separate arrays,
+           so the evaluation can compare plain ints instead of fetching span attributes.
+           The arrays of all the documents are built in one go and reused by every evaluation.
 
         Args:
-            gold_entity_spans (List[Span]): list of gold entity spans
-            pred_entity_spans (List[Span]): list of predicted entity spans
+            span_lists (List[List[Span]]): sorted lists of entity spans for different documents.
 
         Returns:
-            Tuple[ResultAggregator, ResultAggregator]: (Results, Results Grouped by tags)
+            List[Tuple]: (start indices, end indices, type ids) of each document, as arrays
+                consumed by `_kernels.classify`.
         """
+        type_ids = self._type_ids
+        lengths = [len(spans) for spans in span_lists]
 
-        def entity_span_sort_fn(span): return (span.start_idx, span.end_idx)
+        return list(zip(
+            _kernels.int_arrays([span.start_idx for spans in span_lists for span in spans], lengths),
+            _kernels.int_arrays([span.end_idx for spans in span_lists for span in spans], lengths),
+            _kernels.int_arrays([type_ids.get(span.span_type, -1) for spans in span_lists for span in spans], lengths)))
 
-        # sort the entity list so we can make the evaluation faster (O(n)).
-        gold_entity_spans.sort(key=entity_span_sort_fn)
-        pred_entity_spans.sort(key=entity_span_sort_fn)
-
-        # to check if the gold span or pred span was overlapping in last step
-        gold_part_overlap_in_last_step, pred_part_overlap_in_last_step = False, False
+    def evaluate(self) -> Tuple[ResultAggregator, Dict[str, ResultAggregator]]:
+        """Runs the evaluation and return results
 
-        gold_idx, pred_idx = 0, 0
-        results = ResultAggregator()
-        results_grouped_by_tags = defaultdict(lambda: ResultAggregator())
+        Returns:
+            Tuple[ResultAggregator, Dict[str, ResultAggregator]]: (Results, Results Grouped by tags)
+        """
+        self.results = ResultAggregator()
+        self.results_grouped_by_tags = defaultdict(ResultAggregator)
 
-        while gold_idx < len(gold_entity_spans) and pred_idx < len(pred_entity_spans):
-            if gold_entity_spans[gold_idx] == pred_entity_spans[pred_idx]:
-                # Scenario I: Both entity type/labels and spans match perfectly
-                results.add_type_match_bounds_match(
-                    gold_entity_spans[gold_idx], pred_entity_spans[pred_idx])
+        for gold_spans, pred_spans, gold_soa, pred_soa in zip(self.gold_entity_span_lists, self.pred_entity_span_lists,
+                                                              self._gold_soa, self._pred_soa):
+            self._calculate_metrics_for_doc(gold_spans, pred_spans, _classify_doc(gold_soa, pred_soa),
+                                            self.results, self.results_grouped_by_tags)
 
-                gold_span_type = gold_entity_spans[gold_idx].span_type
-                results_grouped_by_tags[gold_span_type].add_type_match_bounds_match(
-                    gold_entity_spans[gold_idx],
-                    pred_entity_spans[pred_idx]
-                )
+        # metrics are only recalculated once all the documents are added
+        self.results.recalculate_metrics_for_all_scorecards()
+        for results_for_tag in self.results_grouped_by_tags.values():
+            results_for_tag.recalculate_metrics_for_all_scorecards()
 
-                # it is safe to move cursor over
-                # as overlapping spans are not allowed within the predicted entity spans list
-                # and is also not allowed within gold entity span list
-                gold_idx += 1
-                pred_idx += 1
+        return self.results, self.results_grouped_by_tags
 
-                gold_part_overlap_in_last_step, pred_part_overlap_in_last_step = False, False
+    @staticmethod
+    def _calculate_metrics_for_doc(gold_entity_spans: List[Span], pred_entity_spans: List[Span],
+                                   classification: Tuple, results: ResultAggregator,
+                                   results_grouped_by_tags: Dict[str, ResultAggregator]) -> None:
+        """Calculate the metrics for a particular document and add them to the given results,
+        the metrics of the scorecards are left for the caller to recalculate.
 
-            elif gold_entity_spans[gold_idx].bounds_same_tokens_as(pred_entity_spans[pred_idx]):
-                # Scenario IV: Wrong Entity types but, spans match perfectly
-                results.add_type_mismatch_bounds_match(
-                    gold_entity_spans[gold_idx], pred_entity_spans[pred_idx])
+        Args:
+            gold_entity_spans (List[Span]): sorted list of gold entity spans
+            pred_entity_spans (List[Span]): sorted list of predicted entity spans
+            classification (Tuple): classification of the spans of the document returned by `_classify_doc`
+            results (ResultAggregator): results to add the metrics of the document to.
+            results_grouped_by_tags (Dict[str, ResultAggregator]): results grouped by tags to add the
+                metrics of the document to, must create missing tags (e.g. `defaultdict(ResultAggregator)`).
+        """
 
-                gold_span_type = gold_entity_spans[gold_idx].span_type
-                results_grouped_by_tags[gold_span_type].add_type_mismatch_bounds_match(
-                    gold_entity_spans[gold_idx],
-                    pred_entity_spans[pred_idx]
-                )
+        codes, gold_indices, pred_indices, gold_tail_idx, pred_tail_idx = classification
+
+        for code, gold_idx, pred_idx in zip(codes, gold_indices, pred_indices):
+            if code == _kernels.MISSED_GOLD_SPAN:
+                gold_span = gold_entity_spans[gold_idx]
+                results.add_missed_gold_span(gold_span, recalculate_metrics=False)
+                results_grouped_by_tags[gold_span.span_type].add_missed_gold_span(gold_span, recalculate_metrics=False)
+            elif code == _kernels.UNECESSARY_PREDICTED_SPAN:
+                pred_span = pred_entity_spans[pred_idx]
+                results.add_unecessary_predicted_span(pred_span, recalculate_metrics=False)
+                results_grouped_by_tags[pred_span.span_type].add_unecessary_predicted_span(
+                    pred_span, recalculate_metrics=False)
+            else:
+                gold_span, pred_span = gold_entity_spans[gold_idx], pred_entity_spans[pred_idx]
+                add_gold_predicted_pair = _GOLD_PREDICTED_PAIR_HANDLERS[code]
+                add_gold_predicted_pair(results, gold_span, pred_span, recalculate_metrics=False)
+                add_gold_predicted_pair(results_grouped_by_tags[gold_span.span_type], gold_span, pred_span,
+                                        recalculate_metrics=False)
 
-                # it is safe to move cursor over
-                # as overlapping spans are not allowed within the predicted entity spans list
-                # and is also not allowed within gold entity span list
-                gold_idx += 1
-                pred_idx += 1
-
-                gold_part_overlap_in_last_step, pred_part_overlap_in_last_step = False, False
-
-            elif gold_entity_spans[gold_idx].overlaps_with(pred_entity_spans[pred_idx]):
-                if gold_entity_spans[gold_idx].span_type == pred_entity_spans[pred_idx].span_type:
-                    # Scenario V: Correct Entity Type, partial span overlap
-                    results.add_type_match_bounds_partial(
-                        gold_entity_spans[gold_idx],
-                        pred_entity_spans[pred_idx]
-                    )
-
-                    gold_span_type = gold_entity_spans[gold_idx].span_type
-                    results_grouped_by_tags[gold_span_type].add_type_match_bounds_partial(
-                        gold_entity_spans[gold_idx],
-                        pred_entity_spans[pred_idx]
-                    )
-                else:
-                    # Scenario VI: Wrong Entity Type, partial span overlap
-                    results.add_type_mismatch_bounds_partial(
-                        gold_entity_spans[gold_idx],
-                        pred_entity_spans[pred_idx]
-                    )
-
-                    gold_span_type = gold_entity_spans[gold_idx].span_type
-                    results_grouped_by_tags[gold_span_type].add_type_mismatch_bounds_partial(
-                        gold_entity_spans[gold_idx],
-                        pred_entity_spans[pred_idx]
-                    )
-
-                if pred_entity_spans[pred_idx].end_idx > gold_entity_spans[gold_idx].end_idx:
-                    pred_part_overlap_in_last_step = True
-                    gold_idx += 1
-                elif pred_entity_spans[pred_idx].end_idx < gold_entity_spans[gold_idx].end_idx:
-                    gold_part_overlap_in_last_step = True
-                    pred_idx += 1
-                else:
-                    gold_idx += 1
-                    pred_idx += 1
-                    gold_part_overlap_in_last_step, pred_part_overlap_in_last_step = False, False
+        # once one side is exhausted, the spans left on the other side are added in bulk
+        missed_gold_spans = gold_entity_spans[gold_tail_idx:]
+        if missed_gold_spans:
+            # Scenario III: missed entities
+            results.add_missed_gold_spans(missed_gold_spans, recalculate_metrics=False)
+            for span_type, spans in _group_by_span_type(missed_gold_spans).items():
+                results_grouped_by_tags[span_type].add_missed_gold_spans(spans, recalculate_metrics=False)
 
-            else:
-                if pred_entity_spans[pred_idx].start_idx > gold_entity_spans[gold_idx].end_idx:
-                    if not gold_part_overlap_in_last_step:
-                        # Scenario III system missed an entity
-                        results.add_missed_gold_span(
-                            gold_entity_spans[gold_idx])
+        unecessary_pred_spans = pred_entity_spans[pred_tail_idx:]
+        if unecessary_pred_spans:
+            # Scenario II: hypothesised entities incorrect
+            results.add_unecessary_predicted_spans(unecessary_pred_spans, recalculate_metrics=False)
+            for span_type, spans in _group_by_span_type(unecessary_pred_spans).items():
+                results_grouped_by_tags[span_type].add_unecessary_predicted_spans(spans, recalculate_metrics=False)
 
-                        gold_span_type = gold_entity_spans[gold_idx].span_type
-                        results_grouped_by_tags[gold_span_type].add_missed_gold_span(
-                            gold_entity_spans[gold_idx]
-                        )
 
-                    gold_idx += 1
-                    gold_part_overlap_in_last_step = False
-                elif pred_entity_spans[pred_idx].end_idx < gold_entity_spans[gold_idx].start_idx:
-                    if not pred_part_overlap_in_last_step:
-                        # Scenario II system hypothesised an extra entity
-                        results.add_unecessary_predicted_span(
-                            pred_entity_spans[pred_idx])
+def _group_by_span_type(spans: List[Span]) -> Dict[str, List[Span]]:
+    """Groups the spans by their type, keeping their order within each group.
 
-                        pred_span_type = pred_entity_spans[pred_idx].span_type
-                        results_grouped_by_tags[pred_span_type].add_unecessary_predicted_span(
-                            pred_entity_spans[pred_idx]
-                        )
+    Args:
+        spans (List[Span]): spans to group.
 
-                    pred_idx += 1
-                    pred_part_overlap_in_last_step = True
+    Returns:
+        Dict[str, List[Span]]: spans for each type.
+    """
+    spans_by_type = defaultdict(list)
+    for span in spans:
+        spans_by_type[span.span_type].append(span)
 
-        if gold_part_overlap_in_last_step:
-            gold_idx += 1
+    return spans_by_type
 
-        while gold_idx < len(gold_entity_spans):
-            # Scenario III: missed entity
-            results.add_missed_gold_span(
-                gold_entity_spans[gold_idx])
 
-            gold_span_type = gold_entity_spans[gold_idx].span_type
-            results_grouped_by_tags[gold_span_type].add_missed_gold_span(
-                gold_entity_spans[gold_idx]
-            )
+def _as_list(items) -> list:
+    """Returns the items as a list, without copying them if they already are one.
+    """
+    return items if type(items) is list else list(items)
 
-            gold_idx += 1
 
-        if pred_part_overlap_in_last_step:
-            pred_idx += 1
-        while pred_idx < len(pred_entity_spans):
-            # Scenario II: hypothesised entity incorrect
-            results.add_unecessary_predicted_span(
-                pred_entity_spans[pred_idx])
+def _classify_doc(gold_soa: Tuple, pred_soa: Tuple) -> Tuple[List[int], List[int], List[int], int, int]:
+    """Classifies the spans of a single document with `_kernels.classify`.
 
-            pred_span_type = pred_entity_spans[pred_idx].span_type
-            results_grouped_by_tags[pred_span_type].add_unecessary_predicted_span(
-                pred_entity_spans[pred_idx]
-            )
+    Args:
+        gold_soa (Tuple): gold entity spans of the document laid out by `NEREvaluator._build_soa`.
+        pred_soa (Tuple): predicted entity spans of the document laid out by `NEREvaluator._build_soa`.
 
-            pred_idx += 1
+    Returns:
+        Tuple[List[int], List[int], List[int], int, int]: (classification codes, gold span indices,
+            predicted span indices, index of the first gold span left over, index of the first
+            predicted span left over), see `_kernels.classify`.
+    """
+    codes, gold_indices, pred_indices = _kernels.empty_output_arrays(len(gold_soa[0]) + len(pred_soa[0]))
+    count, gold_tail_idx, pred_tail_idx = _kernels.classify(
+        *gold_soa, *pred_soa, codes, gold_indices, pred_indices)
 
-        return results, results_grouped_by_tags
+    return (_kernels.to_list(codes, count), _kernels.to_list(gold_indices, count),
+            _kernels.to_list(pred_indices, count), gold_tail_idx, pred_tail_idx)
 
 
 class NERTagListEvaluator(NEREvaluator):
+    # Transitions of the BIO/BILOU tagging scheme between the previous tag and the current tag:
+    #   any tag     -> "O":             outside, ends the current label (if any)
+    #   "O"         -> non-"O" tag:     starts a new label
+    #   label X tag -> label Y tag:     ends label X and starts label Y
+    #   label X tag -> "B-X"/"U-X":     ends label X and starts a new label X
+    #   label X tag -> other X tag:     continues label X
+    VALID_TOKEN_TAG_PREFIXES = ('B', 'I', 'L', 'O', 'U')
+    SPAN_START_TOKEN_TAG_PREFIXES = ('B', 'U')
+
     def __init__(self, tokens: List[List[str]], gold_tag_lists: List[List[str]], pred_tag_lists: List[List[str]], entity_context_padding=0):
-        """Constructor for tag list based evaluator
+        """Constructor for tag list based evaluator, lists passed in are not copied so the
+        evaluator may hold references to them.
 
         Args:
             tokens (List[List[str]]): List of token lists for different documents.
@@ -217,9 +207,9 @@ class NERTagListEvaluator(NEREvaluator):
             pred_tag_lists (List[List[str]]): List of predicted tag lists for different documents.
         """
         # TODO: Check for nesting and convert nested items to list
-        self.tokens = list(tokens)
-        self.gold_tag_lists = list(gold_tag_lists)
-        self.pred_tag_lists = list(pred_tag_lists)
+        self.tokens = _as_list(tokens)
+        self.gold_tag_lists = _as_list(gold_tag_lists)
+        self.pred_tag_lists = _as_list(pred_tag_lists)
         self.entity_context_padding = entity_context_padding
 
         gold_entity_spans = self.__tagged_list_to_span(
@@ -239,82 +229,49 @@ class NERTagListEvaluator(NEREvaluator):
                 List of entity span lists for each document.
         """
         results = []
-        start_offset = None
-        end_offset = None
-        label = None
-        valid_token_tag_prefix = ('B', 'I', 'L', 'O', 'U')
-
-        def get_context_tokens(token_list, start_offset, end_offset): return (
-            token_list[max(0, start_offset-self.entity_context_padding):
-                        min(end_offset+self.entity_context_padding+1, len(token_list))]
-        )
+        valid_token_tag_prefix = self.VALID_TOKEN_TAG_PREFIXES
+        span_start_prefix = self.SPAN_START_TOKEN_TAG_PREFIXES
 
         if len(tag_lists) != len(token_lists):
             raise Exception(
                 'Exception: Number of tags lists and tokens lists are not the same.')
 
         for tag_list, token_list in zip(tag_lists, token_lists):
-            # reset everything
-            labelled_entities = []
-
-            start_offset = None
-            end_offset = None
-            label = None
-
             if len(tag_list) != len(token_list):
                 raise Exception(
                     f'Exception: Number of tags and tokens are not the same.'
                     f'Tag List:{tag_list} Token List: {token_list}'
                 )
 
-            for offset, (token_tag, _) in enumerate(zip(tag_list, token_list)):
-                if token_tag == "O":
-                    # if a sequence of non-"O" tags was seen last and
-                    # a "O" tag is encountered => Label has ended.
-                    if label is not None and start_offset is not None:
-                        end_offset = offset - 1
-                        labelled_entities.append(
-                            Span(label, start_offset,
-                                          end_offset, token_list[start_offset:end_offset+1], 
-                                          get_context_tokens(token_list, start_offset, end_offset))
-                        )
-                        start_offset = None
-                        end_offset = None
-                        label = None
-                # if a non-"O" tag is encoutered => new label has started
-                elif label is None and token_tag.startswith(valid_token_tag_prefix):
-                    label = token_tag[2:]
-                    start_offset = offset
-                # if another label begins => last labelled seq has ended
-                elif (label != token_tag[2:] and token_tag.startswith(valid_token_tag_prefix)) or (
-                    label == token_tag[2:] and (
-                        token_tag[:1] == "B" or token_tag[:1] == "U")
-                ):
-
-                    end_offset = offset - 1
-                    labelled_entities.append(
-                        Span(label, start_offset,
-                                      end_offset, token_list[start_offset:end_offset+1], 
-                                      get_context_tokens(token_list, start_offset, end_offset))
-                    )
-
-                    # start of a new label
-                    label = token_tag[2:]
-                    start_offset = offset
-                    end_offset = None
-                elif not token_tag.startswith(valid_token_tag_prefix):
+            # validate each distinct tag once, in the order of their first occurrence
+            for token_tag in dict.fromkeys(tag_list):
+                if token_tag != "O" and not token_tag.startswith(valid_token_tag_prefix):
                     # TODO: Add line information
                     raise Exception(f'Unknown Token Tag: {token_tag}')
 
-            if label is not None and start_offset is not None and end_offset is None:
-                end_offset = len(tag_list) - 1
-                labelled_entities.append(
-                    Span(label, start_offset, end_offset, token_list[start_offset:end_offset+1], 
-                    get_context_tokens(token_list, start_offset, end_offset))
-                )
+            # the transitions are evaluated for all tags of the document at once:
+            # a label starts on a non-"O" tag that follows a "O" tag or a different label,
+            # or that has a "B"/"U" prefix. Unpacking the tags keeps the scans working on any sequence of tags.
+            start_offsets = [
+                offset for offset, (token_tag, prev_token_tag) in enumerate(zip(tag_list, ["O", *tag_list]))
+                if token_tag != "O" and (prev_token_tag == "O" or token_tag[2:] != prev_token_tag[2:] or
+                                         token_tag[:1] in span_start_prefix)
+            ]
+            # and it ends right before the next "O" tag or the start of the next label.
+            start_offset_set = set(start_offsets)
+            end_offsets = [
+                offset for offset, (token_tag, next_token_tag) in enumerate(zip(tag_list, [*tag_list[1:], "O"]))
+                if token_tag != "O" and (next_token_tag == "O" or offset + 1 in start_offset_set)
+            ]
+
+            # spans only keep a reference to the token list, tokens are sliced out on access.
+            labelled_entities = [
+                Span.from_token_list(tag_list[start_offset][2:], start_offset, end_offset,
+                                     token_list, self.entity_context_padding)
+                for start_offset, end_offset in zip(start_offsets, end_offsets)
+            ]
 
             if len(labelled_entities) > 0:
                 results.append(labelled_entities)
-                labelled_entities = []
 
         return results
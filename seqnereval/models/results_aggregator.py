@@ -58,31 +58,37 @@ class ResultAggregator:
         self.recalculate_metrics_for_all_scorecards() 
 
     # Scenario I
-    def add_type_match_bounds_match(self, gold_span: Span, pred_span: Span) -> None:
+    def add_type_match_bounds_match(self, gold_span: Span, pred_span: Span, recalculate_metrics: bool = True) -> None:
         """Add Gold and Predicted span pair to Scenario I aggregator: both type and bounds match.
 
         Args:
             gold_span (Span): Golden Span.
             pred_span (Span): Predicted Span.
+            recalculate_metrics (bool, optional): Recalculate the metrics of the scorecards.
+                Defaults to True.
         """
 
-        self.type_match_bounds_match.append(GoldPredictedPair(gold_span, pred_span))
+        gold_predicted_pair = GoldPredictedPair(gold_span, pred_span)
+        self.type_match_bounds_match.append(gold_predicted_pair)
 
-        self.strict_match.correct.append(GoldPredictedPair(gold_span, pred_span))
-        self.type_match.correct.append(GoldPredictedPair(gold_span, pred_span))
-        self.partial_match.correct.append(GoldPredictedPair(gold_span, pred_span))
-        self.bounds_match.correct.append(GoldPredictedPair(gold_span, pred_span))
+        self.strict_match.correct.append(gold_predicted_pair)
+        self.type_match.correct.append(gold_predicted_pair)
+        self.partial_match.correct.append(gold_predicted_pair)
+        self.bounds_match.correct.append(gold_predicted_pair)
 
-        self.recalculate_metrics_for_all_scorecards()
+        if recalculate_metrics:
+            self.recalculate_metrics_for_all_scorecards()
 
     # Scenario II
 
-    def add_unecessary_predicted_span(self, uncessary_pred_span: Span) -> None:
+    def add_unecessary_predicted_span(self, uncessary_pred_span: Span, recalculate_metrics: bool = True) -> None:
         """Add wrongly predicted span to the Scenario II aggregate: predicted 
            span doesn't exist in golden dataset.
 
         Args:
             uncessary_pred_span (Span): Span that was wrongly predicted.
+            recalculate_metrics (bool, optional): Recalculate the metrics of the scorecards.
+                Defaults to True.
         """
 
         self.unecessary_predicted_span.append(uncessary_pred_span)
@@ -92,15 +98,37 @@ class ResultAggregator:
         self.partial_match.spurious.append(uncessary_pred_span)
         self.bounds_match.spurious.append(uncessary_pred_span)
 
-        self.recalculate_metrics_for_all_scorecards()
+        if recalculate_metrics:
+            self.recalculate_metrics_for_all_scorecards()
+
+    def add_unecessary_predicted_spans(self, uncessary_pred_spans: List[Span], recalculate_metrics: bool = True) -> None:
+        """Add multiple wrongly predicted spans to the Scenario II aggregate at once.
+
+        Args:
+            uncessary_pred_spans (List[Span]): Spans that were wrongly predicted.
+            recalculate_metrics (bool, optional): Recalculate the metrics of the scorecards.
+                Defaults to True.
+        """
+
+        self.unecessary_predicted_span.extend(uncessary_pred_spans)
+
+        self.strict_match.spurious.extend(uncessary_pred_spans)
+        self.type_match.spurious.extend(uncessary_pred_spans)
+        self.partial_match.spurious.extend(uncessary_pred_spans)
+        self.bounds_match.spurious.extend(uncessary_pred_spans)
+
+        if recalculate_metrics:
+            self.recalculate_metrics_for_all_scorecards()
 
     # Scenario III
-    def add_missed_gold_span(self, missed_gold_span: Span) -> None:
+    def add_missed_gold_span(self, missed_gold_span: Span, recalculate_metrics: bool = True) -> None:
         """Add missed span to Scenario III aggregate: missed span that 
             wasn't predicted
 
         Args:
             missed_gold_span (Span): Span that wasn't predicted.
+            recalculate_metrics (bool, optional): Recalculate the metrics of the scorecards.
+                Defaults to True.
         """
 
         self.missed_gold_span.append(missed_gold_span)
@@ -110,10 +138,30 @@ class ResultAggregator:
         self.partial_match.missed.append(missed_gold_span)
         self.bounds_match.missed.append(missed_gold_span)
 
-        self.recalculate_metrics_for_all_scorecards()
+        if recalculate_metrics:
+            self.recalculate_metrics_for_all_scorecards()
+
+    def add_missed_gold_spans(self, missed_gold_spans: List[Span], recalculate_metrics: bool = True) -> None:
+        """Add multiple missed spans to the Scenario III aggregate at once.
+
+        Args:
+            missed_gold_spans (List[Span]): Spans that weren't predicted.
+            recalculate_metrics (bool, optional): Recalculate the metrics of the scorecards.
+                Defaults to True.
+        """
+
+        self.missed_gold_span.extend(missed_gold_spans)
+
+        self.strict_match.missed.extend(missed_gold_spans)
+        self.type_match.missed.extend(missed_gold_spans)
+        self.partial_match.missed.extend(missed_gold_spans)
+        self.bounds_match.missed.extend(missed_gold_spans)
+
+        if recalculate_metrics:
+            self.recalculate_metrics_for_all_scorecards()
 
     # Scenario IV
-    def add_type_mismatch_bounds_match(self, gold_span: Span, pred_span: Span) -> None:
+    def add_type_mismatch_bounds_match(self, gold_span: Span, pred_span: Span, recalculate_metrics: bool = True) -> None:
         """Add Gold and predicted pair for which bounds were predicted correctly but the 
           type was incorrect.
 
@@ -122,19 +170,23 @@ class ResultAggregator:
                                             but the type was not.
             pred_span (Span): Predicted span for which bounds were correct
                                             but the type was not.
+            recalculate_metrics (bool, optional): Recalculate the metrics of the scorecards.
+                Defaults to True.
         """
 
-        self.type_mismatch_bounds_match.append(GoldPredictedPair(gold_span, pred_span))
+        gold_predicted_pair = GoldPredictedPair(gold_span, pred_span)
+        self.type_mismatch_bounds_match.append(gold_predicted_pair)
 
-        self.strict_match.incorrect.append(GoldPredictedPair(gold_span, pred_span))
-        self.type_match.incorrect.append(GoldPredictedPair(gold_span, pred_span))
-        self.partial_match.correct.append(GoldPredictedPair(gold_span, pred_span))
-        self.bounds_match.correct.append(GoldPredictedPair(gold_span, pred_span))
+        self.strict_match.incorrect.append(gold_predicted_pair)
+        self.type_match.incorrect.append(gold_predicted_pair)
+        self.partial_match.correct.append(gold_predicted_pair)
+        self.bounds_match.correct.append(gold_predicted_pair)
 
-        self.recalculate_metrics_for_all_scorecards()
+        if recalculate_metrics:
+            self.recalculate_metrics_for_all_scorecards()
 
     # Scenario V
-    def add_type_match_bounds_partial(self, gold_span: Span, pred_span: Span) -> None:
+    def add_type_match_bounds_partial(self, gold_span: Span, pred_span: Span, recalculate_metrics: bool = True) -> None:
         """Add Gold and predicted span pair for which bounds were predicted partially correctly whereas the 
              type was predicted correctly. 
 
@@ -143,19 +195,23 @@ class ResultAggregator:
                 whereas the type was predicted correctly. 
             pred_span (Span): Predicted span for which bounds were predicted partially correctly
                 whereas the type was predicted correctly. 
+            recalculate_metrics (bool, optional): Recalculate the metrics of the scorecards.
+                Defaults to True.
         """
 
-        self.type_match_bounds_partial.append(GoldPredictedPair(gold_span, pred_span))
+        gold_predicted_pair = GoldPredictedPair(gold_span, pred_span)
+        self.type_match_bounds_partial.append(gold_predicted_pair)
 
-        self.strict_match.incorrect.append(GoldPredictedPair(gold_span, pred_span))
-        self.type_match.correct.append(GoldPredictedPair(gold_span, pred_span))
-        self.partial_match.partial.append(GoldPredictedPair(gold_span, pred_span))
-        self.bounds_match.incorrect.append(GoldPredictedPair(gold_span, pred_span))
+        self.strict_match.incorrect.append(gold_predicted_pair)
+        self.type_match.correct.append(gold_predicted_pair)
+        self.partial_match.partial.append(gold_predicted_pair)
+        self.bounds_match.incorrect.append(gold_predicted_pair)
 
-        self.recalculate_metrics_for_all_scorecards()
+        if recalculate_metrics:
+            self.recalculate_metrics_for_all_scorecards()
 
     # Scenario VI
-    def add_type_mismatch_bounds_partial(self, gold_span: Span, pred_span: Span) -> None:
+    def add_type_mismatch_bounds_partial(self, gold_span: Span, pred_span: Span, recalculate_metrics: bool = True) -> None:
         """Add Gold and predicted span pair for which bounds were predicted partially correctly and the
                 type was incorrect.
 
@@ -164,17 +220,20 @@ class ResultAggregator:
                 whereas the type was predicted incorrectly. 
             pred_span (Span): Predicted Entity span for which bounds were predicted partially correctly
                 whereas the type was predicted incorrectly. 
+            recalculate_metrics (bool, optional): Recalculate the metrics of the scorecards.
+                Defaults to True.
         """
 
-        self.type_mismatch_bounds_partial.append(
-            GoldPredictedPair(gold_span, pred_span))
+        gold_predicted_pair = GoldPredictedPair(gold_span, pred_span)
+        self.type_mismatch_bounds_partial.append(gold_predicted_pair)
 
-        self.strict_match.incorrect.append(GoldPredictedPair(gold_span, pred_span))
-        self.type_match.incorrect.append(GoldPredictedPair(gold_span, pred_span))
-        self.partial_match.partial.append(GoldPredictedPair(gold_span, pred_span))
-        self.bounds_match.incorrect.append(GoldPredictedPair(gold_span, pred_span))
+        self.strict_match.incorrect.append(gold_predicted_pair)
+        self.type_match.incorrect.append(gold_predicted_pair)
+        self.partial_match.partial.append(gold_predicted_pair)
+        self.bounds_match.incorrect.append(gold_predicted_pair)
 
-        self.recalculate_metrics_for_all_scorecards()
+        if recalculate_metrics:
+            self.recalculate_metrics_for_all_scorecards()
 
     def recalculate_metrics_for_all_scorecards(self) -> None:
         """Recalculates the metrics for all scorecards in the results aggregator.
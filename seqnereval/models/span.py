@@ -1,7 +1,11 @@
 from __future__ import annotations
+import sys
 from typing import List
 
 class Span:
+    __slots__ = ('span_type', 'start_idx', 'end_idx', '_spanned_tokens', '_span_context',
+                 '_token_list', '_context_padding')
+
     def __init__(self,
                  span_type: str,
                  start_idx: int, 
@@ -20,14 +24,97 @@ class Span:
                                         some surrounding tokens for context.
         """
 
-        self.span_type = span_type 
+        # interned so that comparing and hashing types of different spans is mostly a pointer check
+        self.span_type = sys.intern(span_type) if type(span_type) is str else span_type
         self.start_idx = start_idx
         self.end_idx = end_idx
-        self.spanned_tokens = spanned_tokens
+        self._spanned_tokens = spanned_tokens
         if span_context == None:
-            self.span_context = self.spanned_tokens
+            self._span_context = self._spanned_tokens
         else:
-            self.span_context = span_context
+            self._span_context = span_context
+
+        # reference to the tokens of the whole document for spans created with `from_token_list`
+        self._token_list = None
+        self._context_padding = 0
+
+    @classmethod
+    def from_token_list(cls,
+                        span_type: str,
+                        start_idx: int,
+                        end_idx: int,
+                        token_list: List[str],
+                        context_padding: int = 0) -> Span:
+        """
+        Construct a new Span that refers to the tokens of the whole document, the spanned tokens
+        and the context are only sliced out of it when they are accessed.
+
+        Parameters:
+            type (str): type/label of span.
+            start_idx (int): index of the first token that is a part of the span.
+            end_idx (int): index of the last token that is a part of the span.
+            token_list (List[str]): list of all the tokens of the document.
+            context_padding [optional, default = 0] (int): number of tokens around the span to include
+                                        in its context.
+        """
+        span = cls(span_type, start_idx, end_idx)
+        span._token_list = token_list
+        span._context_padding = context_padding
+
+        return span
+
+    @property
+    def spanned_tokens(self) -> List[str]:
+        """List of tokens spanned by the span."""
+        if self._token_list is None:
+            return self._spanned_tokens
+
+        return self._token_list[self.start_idx:self.end_idx+1]
+
+    @spanned_tokens.setter
+    def spanned_tokens(self, spanned_tokens: List[str]) -> None:
+        self.__detach_from_token_list()
+        self._spanned_tokens = spanned_tokens
+
+    @property
+    def span_context(self) -> List[str]:
+        """List of tokens spanned by the span + some surrounding tokens for context."""
+        if self._token_list is None:
+            return self._span_context
+
+        return self._token_list[max(0, self.start_idx-self._context_padding):
+                                self.end_idx+self._context_padding+1]
+
+    @span_context.setter
+    def span_context(self, span_context: List[str]) -> None:
+        self.__detach_from_token_list()
+        self._span_context = span_context
+
+    def __detach_from_token_list(self) -> None:
+        """Slices the tokens and context out of the token list of the document once,
+           so they can be changed independently of it.
+        """
+        if self._token_list is not None:
+            self._spanned_tokens, self._span_context = self.spanned_tokens, self.span_context
+            self._token_list = None
+
+    def __getstate__(self):
+        # only the sliced tokens are pickled, not the token list of the whole document.
+        # slots of subclasses and their `__dict__` are pickled as they are.
+        slots = {name: getattr(self, name)
+                 for cls in type(self).__mro__ for name in cls.__dict__.get('__slots__', ())
+                 if name not in ('__dict__', '__weakref__') and hasattr(self, name)}
+        slots.update(_spanned_tokens=self.spanned_tokens, _span_context=self.span_context,
+                     _token_list=None, _context_padding=0)
+
+        return getattr(self, '__dict__', None), slots
+
+    def __setstate__(self, state):
+        attributes, slots = state
+        if attributes:
+            self.__dict__.update(attributes)
+        for name, value in slots.items():
+            setattr(self, name, value)
 
     def __str__(self):
         return (f'(Type: "{self.span_type}", Token Span IDX:({self.start_idx},'
@@ -38,12 +125,14 @@ class Span:
                 f' {self.end_idx}), Tokens:{self.spanned_tokens}, Context:{self.span_context})')
 
     def __hash__(self):
-        return hash(f'{self.span_type}-{self.start_idx}-{self.end_idx}')
+        # computed from the current attributes, string hashes differ between interpreters
+        # so a hash kept on the span would not survive pickling.
+        return hash((self.start_idx, self.end_idx, self.span_type))
 
     def __eq__(self, other):
-        return (self.span_type == other.span_type and
-                self.start_idx == other.start_idx and
-                self.end_idx == other.end_idx)
+        return (self.start_idx == other.start_idx and
+                self.end_idx == other.end_idx and
+                self.span_type == other.span_type)
 
     def bounds_same_tokens_as(self, otherSpan):
         """
@@ -68,4 +157,3 @@ class Span:
         """
 
         return max(self.start_idx, otherSpan.start_idx) <= min(self.end_idx, otherSpan.end_idx)
-
@@ -34,6 +34,7 @@ setup(
         "Programming Language :: Python :: 3",
         "Operating System :: OS Independent",
     ],
+    extras_require={"numba": ["numba"]},
     tests_require=["pytest"],
     include_package_data=True,
     zip_safe=True,
@@ -175,3 +175,50 @@ def test_ResultAggregator_add_type_mismatch_bounds_partial(mocker: MockerFixture
     assert len(result.bounds_match.incorrect)==1 and sum([len(agg) if type(agg) is list else 0
                                                                     for agg in result.type_match.__dict__.values()])==1
     assert spy.call_count==1
+
+def test_ResultAggregator_add_unecessary_predicted_spans(mocker: MockerFixture):
+    result =  ResultAggregator()
+    spy =  mocker.spy(result,'recalculate_metrics_for_all_scorecards')
+    preds = [generate_random_span('pred') for _ in range(3)]
+    result.add_unecessary_predicted_spans(preds)
+
+    assert result.unecessary_predicted_span == preds
+
+    for scorecard in [result.strict_match, result.type_match, result.partial_match, result.bounds_match]:
+        assert scorecard.spurious == preds and sum([len(agg) if type(agg) is list else 0
+                                                    for agg in scorecard.__dict__.values()])==3
+    assert spy.call_count==1
+
+def test_ResultAggregator_add_missed_gold_spans(mocker: MockerFixture):
+    result =  ResultAggregator()
+    spy =  mocker.spy(result,'recalculate_metrics_for_all_scorecards')
+    golds = [generate_random_span('gold') for _ in range(3)]
+    result.add_missed_gold_spans(golds)
+
+    assert result.missed_gold_span == golds
+
+    for scorecard in [result.strict_match, result.type_match, result.partial_match, result.bounds_match]:
+        assert scorecard.missed == golds and sum([len(agg) if type(agg) is list else 0
+                                                  for agg in scorecard.__dict__.values()])==3
+    assert spy.call_count==1
+
+def test_ResultAggregator_add_without_recalculating_metrics(mocker: MockerFixture):
+    result =  ResultAggregator()
+    spy =  mocker.spy(result,'recalculate_metrics_for_all_scorecards')
+    gold = Span('test', 0, 10)
+    pred = Span('test', 0, 10)
+
+    result.add_type_match_bounds_match(gold, pred, recalculate_metrics=False)
+    result.add_unecessary_predicted_span(pred, recalculate_metrics=False)
+    result.add_unecessary_predicted_spans([pred], recalculate_metrics=False)
+    result.add_missed_gold_span(gold, recalculate_metrics=False)
+    result.add_missed_gold_spans([gold], recalculate_metrics=False)
+    result.add_type_mismatch_bounds_match(gold, pred, recalculate_metrics=False)
+    result.add_type_match_bounds_partial(gold, pred, recalculate_metrics=False)
+    result.add_type_mismatch_bounds_partial(gold, pred, recalculate_metrics=False)
+
+    assert spy.call_count==0
+    assert result.strict_match.possible==0 and result.strict_match.actual==0
+
+    result.recalculate_metrics_for_all_scorecards()
+    assert result.strict_match.possible==6 and result.strict_match.actual==6
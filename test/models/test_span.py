@@ -1,5 +1,20 @@
+import os
+import pickle
+import subprocess
+import sys
+import seqnereval
 from seqnereval.models import Span
 
+
+class ScoredSpan(Span):
+    def __init__(self, span_type, start_idx, end_idx, score):
+        super().__init__(span_type, start_idx, end_idx)
+        self.score = score
+
+
+class SlottedScoredSpan(Span):
+    __slots__ = ('score',)
+
 def test_Span_bounds_same_tokens_as():
     span = Span('test', 10, 15)
 
@@ -50,4 +65,69 @@ def test_Span__repr__():
 
 def test_Span__hash__():
     assert Span('test',1,2,['X1','X2']) in set([Span('test',1,2,['X1','X2'])])
-    assert Span('test',1,3,['X1','X2']) not in set([Span('test',1,2,['X1','X2'])])
\ No newline at end of file
+    assert Span('test',1,3,['X1','X2']) not in set([Span('test',1,2,['X1','X2'])])
+
+def test_Span__eq__():
+    assert Span('test', 1, 2, ['X1', 'X2']) == Span('test', 1, 2)
+    assert Span('test', 1, 2) != Span('other', 1, 2)
+    assert Span('test', 1, 2) != Span('test', 1, 3)
+    assert Span('test', 1, 2) != Span('test', 0, 2)
+
+    span = Span('test', 1, 2)
+    span.start_idx = 0
+    assert span == Span('test', 0, 2)
+    assert span in {Span('test', 0, 2)}
+
+
+def test_Span_pickle():
+    span = pickle.loads(pickle.dumps(Span('test', 1, 2, ['X1', 'X2'])))
+
+    assert span == Span('test', 1, 2)
+    assert span in {Span('test', 1, 2)}
+    assert span.spanned_tokens == ['X1', 'X2']
+
+    tokens = ['The', 'John', 'Doe\'s', 'Basketball', 'Club']
+    pickled_span = pickle.dumps(Span.from_token_list('PER', 1, 2, tokens, 1))
+    assert b'Club' not in pickled_span
+    assert pickle.loads(pickled_span).span_context == ['The', 'John', 'Doe\'s', 'Basketball']
+
+    scored_span = pickle.loads(pickle.dumps(ScoredSpan('test', 1, 2, 0.5)))
+    assert type(scored_span) is ScoredSpan and scored_span.score == 0.5
+    slotted_span = SlottedScoredSpan.from_token_list('PER', 1, 2, tokens)
+    slotted_span.score = 0.5
+    slotted_span = pickle.loads(pickle.dumps(slotted_span))
+    assert type(slotted_span) is SlottedScoredSpan and slotted_span.score == 0.5
+    assert slotted_span.spanned_tokens == ['John', 'Doe\'s']
+
+    # string hashes differ between interpreters
+    check = ("import pickle, sys\n"
+             "from seqnereval.models import Span\n"
+             "assert pickle.loads(sys.stdin.buffer.read()) in {Span('test', 1, 2)}")
+    subprocess.run([sys.executable, '-c', check], input=pickle.dumps(Span('test', 1, 2)), check=True,
+                   env={**os.environ, 'PYTHONHASHSEED': '1',
+                        'PYTHONPATH': os.path.dirname(os.path.dirname(seqnereval.__file__))})
+
+
+def test_Span_from_token_list():
+    tokens = ['The', 'John', 'Doe\'s', 'Basketball', 'Club']
+
+    span = Span.from_token_list('PER', 1, 2, tokens)
+    assert span == Span('PER', 1, 2)
+    assert span.spanned_tokens == ['John', 'Doe\'s']
+    assert span.span_context == ['John', 'Doe\'s']
+
+    padded_span = Span.from_token_list('ORG', 3, 4, tokens, 2)
+    assert padded_span.spanned_tokens == ['Basketball', 'Club']
+    assert padded_span.span_context == ['John', 'Doe\'s', 'Basketball', 'Club']
+
+    padded_span.spanned_tokens = ['Club']
+    assert padded_span.spanned_tokens == ['Club']
+    assert padded_span.span_context == ['John', 'Doe\'s', 'Basketball', 'Club']
+    span.span_context = ['The', 'John', 'Doe\'s']
+    assert span.spanned_tokens == ['John', 'Doe\'s']
+    assert span.span_context == ['The', 'John', 'Doe\'s']
+    assert tokens == ['The', 'John', 'Doe\'s', 'Basketball', 'Club']
+
+
+def test_Span_interns_span_type():
+    assert Span(''.join(['te', 'st']), 1, 2).span_type is Span('test', 3, 4).span_type
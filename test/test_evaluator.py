@@ -4,6 +4,11 @@ import pytest
 import json
 
 
+def span_to_dict(span: Span):
+    return {"spanned_tokens": span.spanned_tokens, "span_context": span.span_context,
+            "span_type": span.span_type, "start_idx": span.start_idx, "end_idx": span.end_idx}
+
+
 def test_ner_taglist_eval_tags_to_span():
     tokens = [
         ['The', 'John', 'Doe\'s', 'Basketball', 'Club'],
@@ -41,9 +46,9 @@ def test_ner_taglist_eval_tags_to_span():
         ]
     ]
     evaluator = NERTagListEvaluator(tokens, before, before)
-    gold_spans = [[span.__dict__ for span in span_list]
+    gold_spans = [[span_to_dict(span) for span in span_list]
                   for span_list in evaluator.gold_entity_span_lists]
-    pred_spans = [[span.__dict__ for span in span_list]
+    pred_spans = [[span_to_dict(span) for span in span_list]
                   for span_list in evaluator.pred_entity_span_lists]
 
     # print(gold_spans)
@@ -82,9 +87,9 @@ def test_ner_taglist_eval_tags_to_span_check_span_context():
         ]
     ]
     evaluator = NERTagListEvaluator(tokens, before, before,2)
-    gold_spans = [[span.__dict__ for span in span_list]
+    gold_spans = [[span_to_dict(span) for span in span_list]
                   for span_list in evaluator.gold_entity_span_lists]
-    pred_spans = [[span.__dict__ for span in span_list]
+    pred_spans = [[span_to_dict(span) for span in span_list]
                   for span_list in evaluator.pred_entity_span_lists]
 
     # print(gold_spans)
@@ -596,3 +601,42 @@ def test_ner_evaluator_summarize_results():
         "recall": 0,
         "f1": 0,
     }}
+
+
+def test_ner_evaluator_sorts_copies_of_span_lists():
+    gold_entities = [[Span("LOC", 127, 134), Span("PER", 59, 69)]]
+    predicted_entities = [[Span("PER", 164, 174), Span("PER", 24, 30)]]
+
+    evaluator = NEREvaluator(gold_entities, predicted_entities)
+
+    assert evaluator.gold_entity_span_lists == [[Span("PER", 59, 69), Span("LOC", 127, 134)]]
+    assert evaluator.pred_entity_span_lists == [[Span("PER", 24, 30), Span("PER", 164, 174)]]
+    assert gold_entities == [[Span("LOC", 127, 134), Span("PER", 59, 69)]]
+    assert predicted_entities == [[Span("PER", 164, 174), Span("PER", 24, 30)]]
+
+
+def test_ner_evaluator_unique_gold_tags_order():
+    gold_entities = [[Span("PER", 59, 69), Span("LOC", 127, 134)], [Span("MISC", 1, 2), Span("PER", 4, 5)]]
+    predicted_entities = [[], []]
+
+    assert NEREvaluator(gold_entities, predicted_entities).unique_gold_tags == ["PER", "LOC", "MISC"]
+
+
+def test_ner_taglist_eval_accepts_non_list_inputs():
+    tokens = (('The', 'John', 'Doe\'s', 'Basketball', 'Club'),)
+    tags = (("O", "B-PER", "I-PER", "B-ORG", "I-ORG"),)
+
+    evaluator = NERTagListEvaluator(iter(tokens), iter(tags), tags)
+    assert evaluator.gold_entity_span_lists == [[Span("PER", 1, 2), Span("ORG", 3, 4)]]
+    assert evaluator.gold_entity_span_lists == evaluator.pred_entity_span_lists
+    assert list(evaluator.gold_entity_span_lists[0][0].spanned_tokens) == ['John', 'Doe\'s']
+
+    token_lists = [list(tokens[0])]
+    assert NERTagListEvaluator(token_lists, [list(tags[0])], [list(tags[0])]).tokens is token_lists
+
+
+def test_ner_taglist_eval_accepts_tuple_tag_lists():
+    evaluator = NERTagListEvaluator([['a', 'b', 'c']], [('B-X', 'I-X', 'O')], [('B-X', 'O', 'U-Y')])
+
+    assert evaluator.gold_entity_span_lists == [[Span("X", 0, 1)]]
+    assert evaluator.pred_entity_span_lists == [[Span("X", 0, 0), Span("Y", 2, 2)]]
@@ -0,0 +1,69 @@
+import pytest
+from seqnereval import _kernels
+
+
+@pytest.fixture(params=['numba', 'numpy', 'lists'])
+def kernel(request, monkeypatch):
+    """The classification kernel, compiled with numba or as plain Python over numpy arrays or lists."""
+    if request.param != 'lists' and _kernels.np is None:
+        pytest.skip('numba is not installed')
+    if request.param == 'lists':
+        monkeypatch.setattr(_kernels, 'np', None)
+    if request.param == 'numba':
+        return _kernels.classify
+
+    return getattr(_kernels.classify, 'py_func', _kernels.classify)
+
+
+def int_array(values):
+    return _kernels.int_arrays(values, [len(values)])[0]
+
+
+def classify(kernel, gold_spans, pred_spans):
+    gold_soa = [int_array([span[field] for span in gold_spans]) for field in range(3)]
+    pred_soa = [int_array([span[field] for span in pred_spans]) for field in range(3)]
+    codes, gold_indices, pred_indices = _kernels.empty_output_arrays(len(gold_spans) + len(pred_spans))
+    count, gold_tail_idx, pred_tail_idx = kernel(*gold_soa, *pred_soa, codes, gold_indices, pred_indices)
+
+    scenarios = list(zip(_kernels.to_list(codes, count),
+                         _kernels.to_list(gold_indices, count),
+                         _kernels.to_list(pred_indices, count)))
+    assert all(type(value) is int for scenario in scenarios for value in scenario)
+
+    return scenarios, gold_tail_idx, pred_tail_idx
+
+
+def test_classify_scenarios(kernel):
+    # (start_idx, end_idx, type_id)
+    gold_spans = [(59, 69, 0), (127, 134, 1), (164, 174, 1), (197, 205, 1), (230, 240, 2)]
+    pred_spans = [(24, 30, 0), (124, 134, 1), (164, 174, 0), (197, 205, 1), (225, 243, 1)]
+
+    assert classify(kernel, gold_spans, pred_spans) == ([
+        (_kernels.UNECESSARY_PREDICTED_SPAN, -1, 0),
+        (_kernels.MISSED_GOLD_SPAN, 0, -1),
+        (_kernels.TYPE_MATCH_BOUNDS_PARTIAL, 1, 1),
+        (_kernels.TYPE_MISMATCH_BOUNDS_MATCH, 2, 2),
+        (_kernels.TYPE_MATCH_BOUNDS_MATCH, 3, 3),
+        (_kernels.TYPE_MISMATCH_BOUNDS_PARTIAL, 4, 4),
+    ], 5, 5)
+
+
+def test_classify_left_over_spans(kernel):
+    assert classify(kernel, [(10, 32, 0)], []) == ([], 0, 0)
+    assert classify(kernel, [], [(10, 32, 0)]) == ([], 0, 0)
+    assert classify(kernel, [], []) == ([], 0, 0)
+
+    # the partially overlapping predicted span isn't left over
+    assert classify(kernel, [(0, 5, 0)], [(3, 8, 0), (10, 12, 0)]) == ([(_kernels.TYPE_MATCH_BOUNDS_PARTIAL, 0, 0)], 1, 1)
+    assert classify(kernel, [(0, 5, 0), (10, 12, 0)], [(0, 5, 0)]) == ([(_kernels.TYPE_MATCH_BOUNDS_MATCH, 0, 0)], 1, 1)
+
+
+def test_type_mismatch_codes_follow_type_match_codes():
+    assert _kernels.TYPE_MATCH_BOUNDS_MATCH + _kernels.TYPE_MISMATCH_OFFSET == _kernels.TYPE_MISMATCH_BOUNDS_MATCH
+    assert _kernels.TYPE_MATCH_BOUNDS_PARTIAL + _kernels.TYPE_MISMATCH_OFFSET == _kernels.TYPE_MISMATCH_BOUNDS_PARTIAL
+
+
+def test_int_arrays(kernel):
+    arrays = _kernels.int_arrays([1, 2, 3, 4, 5, 6], [2, 0, 3, 1])
+    assert [list(array) for array in arrays] == [[1, 2], [], [3, 4, 5], [6]]
+    assert _kernels.int_arrays([], []) == []